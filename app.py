@@ -1,7 +1,8 @@
 import streamlit as st
 import polars as pl
+import numpy as np
 import plotly.graph_objects as go
-from taxes import calculate_norwegian_tax
+from taxes import calculate_tax_result
 
 # Set page configuration
 st.set_page_config(
@@ -155,215 +156,178 @@ other_expenses = st.sidebar.slider('Other Expenses (NOK/month)', min_value=0, ma
 # Calculate total monthly expenses (excluding mortgage)
 monthly_expenses = joint_dept + groceries + utilities + transportation + entertainment + other_expenses
 
-# Create mortgage amortization schedule
+# Create mortgage amortization schedule, aggregated by year
 def calculate_mortgage_schedule(loan_amount, annual_interest_rate, term_years):
     monthly_interest_rate = annual_interest_rate / 100 / 12
     total_payments = term_years * 12
-    
-    # Calculate monthly payment
+    monthly_payment = calculate_monthly_payment(loan_amount, annual_interest_rate, term_years)
+
+    # Closed-form balance after k payments: B(k) = P(1+r)^k - M((1+r)^k - 1) / r
+    payments_made = np.arange(total_payments + 1)
     if annual_interest_rate == 0:
-        monthly_payment = loan_amount / total_payments
+        balance = loan_amount - monthly_payment * payments_made
     else:
-        monthly_payment = calculate_monthly_payment(loan_amount, annual_interest_rate, term_years)
-    
-    remaining_balance = loan_amount
-    schedule = []
-    
-    for payment_num in range(1, total_payments + 1):
-        interest_payment = remaining_balance * monthly_interest_rate
-        principal_payment = monthly_payment - interest_payment
-        
-        if principal_payment > remaining_balance:
-            principal_payment = remaining_balance
-            monthly_payment = principal_payment + interest_payment
-            
-        remaining_balance -= principal_payment
-        
-        if remaining_balance < 0:
-            remaining_balance = 0
-            
-        year = (payment_num - 1) // 12 + 1
-        
-        schedule.append({
-            'Payment_Number': payment_num,
-            'Year': year,
-            'Monthly_Payment': monthly_payment,
-            'Principal_Payment': principal_payment,
-            'Interest_Payment': interest_payment,
-            'Remaining_Balance': remaining_balance
-        })
-    
-    return schedule
-
-# Generate projections for 30 years
-years = list(range(1, 31))
-financial_data = []
-
-# Initialize values
-current_salary = base_salary
-current_expenses = {
-    'Joint Dept': joint_dept,
-    'groceries': groceries,
-    'utilities': utilities,
-    'transportation': transportation,
-    'entertainment': entertainment,
-    'other_expenses': other_expenses
+        growth = (1 + monthly_interest_rate) ** payments_made
+        balance = loan_amount * growth - monthly_payment * (growth - 1) / monthly_interest_rate
+    balance = np.maximum(balance, 0)
+
+    opening_balance = balance[:-1]
+    interest_payment = opening_balance * monthly_interest_rate
+    # The final payment only covers what is left of the loan
+    principal_payment = np.minimum(monthly_payment - interest_payment, opening_balance)
+    remaining_balance = np.maximum(opening_balance - principal_payment, 0)
+
+    # Payments are in order and there are 12 per year, so each series reshapes to one row per year
+    principal_by_year = principal_payment.reshape(term_years, 12)
+    interest_by_year = interest_payment.reshape(term_years, 12)
+    annual_principal = principal_by_year.sum(axis=1)
+    annual_interest = interest_by_year.sum(axis=1)
+
+    return {
+        'Annual_Mortgage_Payment': annual_principal + annual_interest,
+        'Annual_Principal': annual_principal,
+        'Annual_Interest': annual_interest,
+        'Year_End_Balance': remaining_balance.reshape(term_years, 12)[:, -1]
+    }
+
+# Expense category columns, in the same order as the budget sliders
+EXPENSE_NAMES = ['Joint Dept', 'Groceries', 'Utilities', 'Transportation', 'Entertainment', 'Other_Expenses']
+
+# Column types of the projection DataFrame, in column order. Passing them to pl.DataFrame skips
+# dtype inference; Year fits comfortably in Int32, everything else is a float64 amount or rate
+PROJECTION_SCHEMA = {
+    'Year': pl.Int32,
+    **{name: pl.Float64 for name in [
+        'Gross_Salary', 'Net_Salary', 'Gross_Monthly', 'Net_Monthly', *EXPENSE_NAMES,
+        'Monthly_Expenses', 'Annual_Expenses', 'Monthly_Mortgage', 'Annual_Mortgage', 'Annual_Principal',
+        'Annual_Interest', 'Remaining_Balance', 'Monthly_Outflow', 'Annual_Outflow', 'Monthly_Savings',
+        'Annual_Savings', 'Savings_Rate_Pct', 'Cumulative_Savings', 'Real_Cumulative_Savings', 'Inflation_Factor',
+        'Real_Net_Salary', 'Real_Monthly_Income', 'Real_Monthly_Expenses', 'Real_Monthly_Mortgage',
+        'Real_Monthly_Outflow', 'Real_Monthly_Savings', 'Total_Tax', 'Effective_Tax_Rate', 'Income_Tax',
+        'Bracket_Tax', 'Social_Security', 'Interest_Deduction', 'Municipal_Wealth_Tax', 'State_Wealth_Tax',
+        'Current_Wealth'
+    ]}
 }
-current_wealth = initial_wealth
-
-# Calculate mortgage data
-mortgage_schedule = calculate_mortgage_schedule(loan_amount, interest_rate, loan_term_years)
-mortgage_df = pl.DataFrame(mortgage_schedule)
-
-# Aggregate mortgage data by year
-mortgage_yearly = (mortgage_df
-    .group_by('Year')
-    .agg([
-        pl.col('Monthly_Payment').sum().alias('Annual_Mortgage_Payment'),
-        pl.col('Principal_Payment').sum().alias('Annual_Principal'),
-        pl.col('Interest_Payment').sum().alias('Annual_Interest')
-    ])
-    .with_columns(pl.col('Year').cast(pl.Int64))
-    .sort('Year')
-)
 
-# Get remaining balance at the end of each year
-remaining_balance_yearly = (mortgage_df
-    .filter(pl.col('Payment_Number') % 12 == 0)
-    .select(['Year', pl.col('Remaining_Balance').alias('Year_End_Balance')])
-)
+# Build the full 30-year projection. Cached on the input values, so reruns that
+# don't change any input reuse the previous result. The cached DataFrame and stats are
+# shared rather than copied on every read, so nothing may modify them.
+@st.cache_resource(show_spinner=False)
+def build_projection(base_salary, annual_increase, income_type, initial_wealth, primary_home_value,
+                     other_loans, bank_balance, other_loans_interest_rate, inflation_rate,
+                     cost_of_living_increase, savings_return_rate, loan_amount, loan_term_years,
+                     interest_rate, joint_dept, groceries, utilities, transportation,
+                     entertainment, other_expenses):
+    # Calculate yearly mortgage data
+    mortgage_yearly = calculate_mortgage_schedule(loan_amount, interest_rate, loan_term_years)
 
-# If the loan term is not a multiple of 12, add the last payment
-if len(remaining_balance_yearly) < loan_term_years:
-    last_payment = mortgage_df.tail(1)
-    remaining_balance_yearly = pl.concat([
-        remaining_balance_yearly,
-        pl.DataFrame({
-            'Year': last_payment['Year'],
-            'Year_End_Balance': last_payment['Remaining_Balance']
-        })
-    ])
+    # Generate projections for 30 years
+    years = np.arange(1, 31)
+    elapsed_years = years - 1
 
-# Join the mortgage data
-mortgage_yearly = mortgage_yearly.join(remaining_balance_yearly, on='Year', how='left')
-mortgage_yearly = mortgage_yearly.fill_null(0)
+    # Salary and cost of living grow geometrically from year 1
+    gross_salary = base_salary * (1 + annual_increase/100) ** elapsed_years
+    cost_of_living_growth = (1 + cost_of_living_increase/100) ** elapsed_years
+    inflation_factor = (1 + inflation_rate/100) ** -elapsed_years
+
+    # Monthly expenses per category (rows) and year (columns). Every category grows by the
+    # same factor, so the total is just the year-1 total scaled by it
+    base_expenses = np.array([joint_dept, groceries, utilities, transportation, entertainment, other_expenses], dtype=np.float64)
+    expense_matrix = base_expenses[:, None] * cost_of_living_growth[None, :]
+    monthly_total_expenses = base_expenses.sum() * cost_of_living_growth
+    annual_total_expenses = monthly_total_expenses * 12
+
+    # Align the yearly mortgage figures with the projection years (zero once the loan is paid off)
+    mortgage_years = min(loan_term_years, len(years))
+
+    def mortgage_by_year(column):
+        values = np.zeros(len(years))
+        values[:mortgage_years] = mortgage_yearly[column][:mortgage_years]
+        return values
+
+    annual_mortgage = mortgage_by_year('Annual_Mortgage_Payment')
+    annual_principal = mortgage_by_year('Annual_Principal')
+    annual_interest = mortgage_by_year('Annual_Interest')
+    remaining_balance = mortgage_by_year('Year_End_Balance')
+    monthly_mortgage = annual_mortgage / 12
 
-# Generate financial projections year by year
-cumulative_savings = 0
-for year in years:
-    # Use current year for tax calculations (limit to 2025 as max year supported)
-    tax_year = min(2025, 2024 + year)  # Use 2024 or 2025 depending on the year
-    
-    # Calculate salary for this year
-    gross_salary = current_salary
-    
-    # Calculate total remaining mortgage
-    if year <= len(mortgage_yearly):
-        mortgage_row = mortgage_yearly.filter(pl.col('Year') == year)
-        remaining_mortgage = mortgage_row['Year_End_Balance'][0]
-    else:
-        remaining_mortgage = 0
-    
-    # Calculate wealth appreciation (simple approach - increases with savings plus some appreciation)
-    if year > 1:
-        current_wealth += financial_data[-1]['Annual_Savings'] * (1 + savings_return_rate/100)
-    
-    # Calculate Norwegian taxes
-    tax_result = calculate_norwegian_tax(
-        income=gross_salary,
-        wealth=current_wealth,
-        loans=other_loans,
-        mortgage=remaining_mortgage,
-        year=tax_year,
-        primary_home_value=primary_home_value,
-        bank_balance=bank_balance,
-        income_type=income_type,
-        mortgage_interest_rate=interest_rate/100,
-        other_loans_interest_rate=other_loans_interest_rate/100
-    )
-    
-    # Extract tax information
-    total_tax = tax_result['total_tax']
-    effective_tax_rate = tax_result['effective_tax_rate']
-    
-    # Calculate net salary using the calculated tax rate
-    net_salary = gross_salary * (1 - effective_tax_rate)
-    
-    # Calculate monthly values
-    gross_monthly = gross_salary / 12
-    net_monthly = net_salary / 12
-    
-    # Get expense values for this year
-    if year == 1:
-        year_expenses = current_expenses.copy()
-        monthly_total_expenses = sum(year_expenses.values())
-        annual_total_expenses = monthly_total_expenses * 12
-    else:
-        # Apply cost of living increase
-        for category in current_expenses:
-            current_expenses[category] *= (1 + cost_of_living_increase/100)
-        
-        year_expenses = current_expenses.copy()
-        monthly_total_expenses = sum(year_expenses.values())
-        annual_total_expenses = monthly_total_expenses * 12
-    
-    # Get mortgage data for this year
-    if year <= len(mortgage_yearly):
-        mortgage_row = mortgage_yearly.filter(pl.col('Year') == year)
-        annual_mortgage = mortgage_row['Annual_Mortgage_Payment'][0]
-        annual_principal = mortgage_row['Annual_Principal'][0]
-        annual_interest = mortgage_row['Annual_Interest'][0]
-        remaining_balance = mortgage_row['Year_End_Balance'][0]
-        monthly_mortgage = annual_mortgage / 12
-    else:
-        annual_mortgage = 0
-        annual_principal = 0
-        annual_interest = 0
-        remaining_balance = 0
-        monthly_mortgage = 0
-    
     # Calculate total monthly outflow (all expenses + mortgage)
     monthly_outflow = monthly_total_expenses + monthly_mortgage
     annual_outflow = monthly_outflow * 12
-    
-    # Calculate savings potential
-    monthly_savings_potential = net_monthly - monthly_outflow
-    annual_savings_potential = monthly_savings_potential * 12
-    
-    # Calculate inflation factor
-    inflation_factor = (1 / (1 + inflation_rate/100) ** (year - 1))
-    
+
+    # Taxes depend on wealth, which grows with the previous year's savings, so this part stays sequential
+    tax_years = np.minimum(2025, 2024 + years).tolist()  # Use 2024 or 2025 depending on the year
+    tax_columns = ['income_tax', 'bracket_tax', 'social_security', 'interest_deduction', 'municipal_wealth_tax', 'state_wealth_tax']
+    tax_components = {name: np.zeros(len(years)) for name in tax_columns}
+    total_tax = np.zeros(len(years))
+    effective_tax_rate = np.zeros(len(years))
+    net_salary = np.zeros(len(years))
+    annual_savings_potential = np.zeros(len(years))
+    current_wealth = np.zeros(len(years))
+
+    # Loop invariants
+    savings_return_factor = 1 + savings_return_rate/100
+    mortgage_interest_rate = interest_rate/100
+    loans_interest_rate = other_loans_interest_rate/100
+
+    wealth = initial_wealth
+    for i in range(len(years)):
+        # Calculate wealth appreciation (simple approach - increases with savings plus some appreciation)
+        if i > 0:
+            wealth += annual_savings_potential[i - 1] * savings_return_factor
+        current_wealth[i] = wealth
+
+        # Calculate Norwegian taxes
+        tax_result = calculate_tax_result(
+            income=gross_salary[i],
+            wealth=wealth,
+            loans=other_loans,
+            mortgage=remaining_balance[i],
+            year=tax_years[i],
+            primary_home_value=primary_home_value,
+            bank_balance=bank_balance,
+            income_type=income_type,
+            mortgage_interest_rate=mortgage_interest_rate,
+            other_loans_interest_rate=loans_interest_rate
+        )
+
+        total_tax[i] = tax_result.total_tax
+        effective_tax_rate[i] = tax_result.effective_tax_rate
+        for name in tax_columns:
+            tax_components[name][i] = getattr(tax_result, name)
+
+        # Calculate net salary and savings potential using the calculated tax rate
+        net_salary[i] = gross_salary[i] * (1 - effective_tax_rate[i])
+        annual_savings_potential[i] = net_salary[i] - annual_outflow[i]
+
+    # Calculate monthly values
+    gross_monthly = gross_salary / 12
+    net_monthly = net_salary / 12
+    monthly_savings_potential = annual_savings_potential / 12
+    savings_rate_pct = monthly_savings_potential / net_monthly * 100
+
+    # Calculate cumulative savings with compound interest:
+    # C[t] = C[t-1] * (1 + r) + S[t]  ==  (1 + r)^t * cumsum(S[k] / (1 + r)^k)
+    savings_growth = savings_return_factor ** elapsed_years
+    cumulative_savings = np.cumsum(annual_savings_potential / savings_growth) * savings_growth
+
     # Calculate real (inflation-adjusted) values
     real_net_salary = net_salary * inflation_factor
-    real_gross_monthly = gross_monthly * inflation_factor
     real_net_monthly = net_monthly * inflation_factor
     real_monthly_expenses = monthly_total_expenses * inflation_factor
     real_monthly_mortgage = monthly_mortgage * inflation_factor
+    real_monthly_outflow = monthly_outflow * inflation_factor
     real_monthly_savings = monthly_savings_potential * inflation_factor
-    
-    # Calculate cumulative savings with compound interest
-    if year == 1:
-        cumulative_savings = annual_savings_potential
-    else:
-        # Apply return rate to existing savings, then add new savings
-        cumulative_savings = cumulative_savings * (1 + savings_return_rate/100) + annual_savings_potential
-    
-    # Calculate real cumulative savings (adjusted for inflation)
     real_cumulative_savings = cumulative_savings * inflation_factor
-    
-    # Store the data
-    financial_data.append({
-        'Year': year,
+
+    # Build the DataFrame column by column
+    columns = {
+        'Year': years,
         'Gross_Salary': gross_salary,
         'Net_Salary': net_salary,
         'Gross_Monthly': gross_monthly,
         'Net_Monthly': net_monthly,
-        'Joint Dept': year_expenses['Joint Dept'],
-        'Groceries': year_expenses['groceries'],
-        'Utilities': year_expenses['utilities'],
-        'Transportation': year_expenses['transportation'],
-        'Entertainment': year_expenses['entertainment'],
-        'Other_Expenses': year_expenses['other_expenses'],
+        **dict(zip(EXPENSE_NAMES, expense_matrix)),
         'Monthly_Expenses': monthly_total_expenses,
         'Annual_Expenses': annual_total_expenses,
         'Monthly_Mortgage': monthly_mortgage,
@@ -375,6 +339,7 @@ for year in years:
         'Annual_Outflow': annual_outflow,
         'Monthly_Savings': monthly_savings_potential,
         'Annual_Savings': annual_savings_potential,
+        'Savings_Rate_Pct': savings_rate_pct,
         'Cumulative_Savings': cumulative_savings,
         'Real_Cumulative_Savings': real_cumulative_savings,
         'Inflation_Factor': inflation_factor,
@@ -382,365 +347,658 @@ for year in years:
         'Real_Monthly_Income': real_net_monthly,
         'Real_Monthly_Expenses': real_monthly_expenses,
         'Real_Monthly_Mortgage': real_monthly_mortgage,
+        'Real_Monthly_Outflow': real_monthly_outflow,
         'Real_Monthly_Savings': real_monthly_savings,
         'Total_Tax': total_tax,
         'Effective_Tax_Rate': effective_tax_rate,
-        'Income_Tax': tax_result['tax_components'].get('income_tax', 0),
-        'Bracket_Tax': tax_result['tax_components'].get('bracket_tax', 0),
-        'Social_Security': tax_result['tax_components'].get('social_security', 0),
-        'Interest_Deduction': tax_result['tax_components'].get('interest_deduction', 0),
-        'Municipal_Wealth_Tax': tax_result['tax_components'].get('municipal_wealth_tax', 0),
-        'State_Wealth_Tax': tax_result['tax_components'].get('state_wealth_tax', 0),
+        'Income_Tax': tax_components['income_tax'],
+        'Bracket_Tax': tax_components['bracket_tax'],
+        'Social_Security': tax_components['social_security'],
+        'Interest_Deduction': tax_components['interest_deduction'],
+        'Municipal_Wealth_Tax': tax_components['municipal_wealth_tax'],
+        'State_Wealth_Tax': tax_components['state_wealth_tax'],
         'Current_Wealth': current_wealth
-    })
-    
-    # Update salary for next year
-    current_salary *= (1 + annual_increase/100)
+    }
+    # Lifetime figures for the summary, computed here so reruns only read them
+    total_contributions = annual_savings_potential.sum()
+    compound_gain = cumulative_savings[-1] - total_contributions
+    stats = {
+        'Total_Net_Income': net_salary.sum(),
+        'Total_Mortgage': annual_mortgage.sum(),
+        'Total_Expenses': annual_total_expenses.sum(),
+        'Total_Contributions': total_contributions,
+        'Compound_Gain': compound_gain,
+        'Compound_Percentage': (compound_gain / total_contributions) * 100 if total_contributions > 0 else 0,
+        'End_Power': inflation_factor[-1] * 100
+    }
+    return pl.DataFrame(columns, schema=PROJECTION_SCHEMA), stats
 
-# Convert to DataFrame
-df = pl.DataFrame(financial_data)
+df, stats = build_projection(
+    base_salary, annual_increase, income_type, initial_wealth, primary_home_value,
+    other_loans, bank_balance, other_loans_interest_rate, inflation_rate,
+    cost_of_living_increase, savings_return_rate, loan_amount, loan_term_years,
+    interest_rate, joint_dept, groceries, utilities, transportation,
+    entertainment, other_expenses
+)
 
-# Display data in tabs
-st.subheader('Financial Projections Over 30 Years')
-tabs = st.tabs(['Overview', 'Income', 'Expenses', 'Mortgage', 'Savings', 'Inflation Impact', 'Taxes'])
+# Materialize every column as a NumPy array once; all charts read from these instead of
+# converting the same columns again
+arrs = {name: df[name].to_numpy() for name in df.columns}
+
+# Expense categories shown in the expense charts and table; mortgage comes from its own column
+expense_categories = ['Mortgage'] + EXPENSE_NAMES
+
+# Chart builders. Each figure depends only on the projection arrays (and a few inputs), so it is
+# cached and only rebuilt when those change. The cached figure object itself is shared across reruns
+# and sessions instead of being copied, so it must not be modified after it is returned.
+@st.cache_resource(show_spinner=False)
+def make_overview_fig(arrs):
+    year = arrs['Year']
 
-with tabs[0]:
-    # Show key metrics for the first year
-    st.write("### Current Financial Snapshot (Year 1)")
-    
-    # First row - income and expenses
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Monthly Net Income", f"{df['Net_Monthly'][0]:,.0f} NOK")
-    
-    with col2:
-        st.metric("Monthly Expenses", f"{df['Monthly_Expenses'][0]:,.0f} NOK")
-    
-    with col3:
-        st.metric("Monthly Mortgage", f"{df['Monthly_Mortgage'][0]:,.0f} NOK")
-    
-    with col4:
-        st.metric("Monthly Savings Potential", f"{df['Monthly_Savings'][0]:,.0f} NOK")
-    
-    # Show overview of financial projection
-    st.write("### Financial Overview Over Time")
-    
     # Create overview visualization
-    fig_overview = go.Figure()
-    
-    # Add net income line
-    fig_overview.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Net_Monthly'],
-            name='Net Monthly Income',
-            line=dict(color='blue', width=2),
-            hovertemplate='Year %{x}<br>Net Income: %{y:,.0f} NOK<extra></extra>'
+    return go.Figure(
+        data=[
+            # Net income line
+            go.Scatter(
+                x=year,
+                y=arrs['Net_Monthly'],
+                mode='lines',
+                name='Net Monthly Income',
+                line=dict(color='blue', width=2),
+                hovertemplate='Year %{x}<br>Net Income: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Stacked bars for expenses
+            go.Bar(
+                x=year,
+                y=arrs['Monthly_Mortgage'],
+                name='Mortgage',
+                marker_color='red',
+                hovertemplate='Year %{x}<br>Mortgage: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Bar(
+                x=year,
+                y=arrs['Monthly_Expenses'],
+                name='Living Expenses',
+                marker_color='orange',
+                hovertemplate='Year %{x}<br>Expenses: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Savings line
+            go.Scatter(
+                x=year,
+                y=arrs['Monthly_Savings'],
+                mode='lines',
+                name='Monthly Savings',
+                line=dict(color='green', width=2),
+                hovertemplate='Year %{x}<br>Savings: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Monthly Financial Overview',
+            xaxis_title='Year',
+            yaxis_title='NOK per Month',
+            barmode='stack',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    # Add stacked bar for expenses
-    fig_overview.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Monthly_Mortgage'],
-            name='Mortgage',
-            marker_color='red',
-            hovertemplate='Year %{x}<br>Mortgage: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_income_fig(arrs):
+    year = arrs['Year']
+
+    # Create income visualization
+    return go.Figure(
+        data=[
+            # Gross salary
+            go.Scatter(
+                x=year,
+                y=arrs['Gross_Salary'],
+                mode='lines',
+                name='Gross Annual Salary',
+                line=dict(color='darkblue', width=2),
+                hovertemplate='Year %{x}<br>Gross Salary: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Net salary
+            go.Scatter(
+                x=year,
+                y=arrs['Net_Salary'],
+                mode='lines',
+                name='Net Annual Salary',
+                line=dict(color='blue', width=2),
+                hovertemplate='Year %{x}<br>Net Salary: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Real net salary
+            go.Scatter(
+                x=year,
+                y=arrs['Real_Net_Salary'],
+                mode='lines',
+                name='Real Net Salary (Inflation Adjusted)',
+                line=dict(color='lightblue', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Real Net Salary: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Tax as area
+            go.Scatter(
+                x=year,
+                y=arrs['Total_Tax'],
+                mode='lines',
+                name='Tax Amount',
+                fill='tozeroy',
+                line=dict(color='red', width=0),
+                hovertemplate='Year %{x}<br>Tax: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Annual Income Growth with Inflation Adjustment',
+            xaxis_title='Year',
+            yaxis_title='NOK per Year',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    fig_overview.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Monthly_Expenses'],
-            name='Living Expenses',
-            marker_color='orange',
-            hovertemplate='Year %{x}<br>Expenses: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_monthly_income_fig(arrs):
+    year = arrs['Year']
+
+    # Show monthly income growth
+    return go.Figure(
+        data=[
+            go.Scatter(
+                x=year,
+                y=arrs['Net_Monthly'],
+                mode='lines',
+                name='Nominal Net Monthly',
+                line=dict(color='blue', width=2),
+                hovertemplate='Year %{x}<br>Net Monthly: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Scatter(
+                x=year,
+                y=arrs['Real_Monthly_Income'],
+                mode='lines',
+                name='Real Net Monthly (Inflation Adjusted)',
+                line=dict(color='blue', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Real Monthly: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Monthly Income Growth (Nominal vs Real)',
+            xaxis_title='Year',
+            yaxis_title='NOK per Month',
+            hovermode='x unified',
+            height=400
         )
     )
-    
-    # Add savings line
-    fig_overview.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Monthly_Savings'],
-            name='Monthly Savings',
-            line=dict(color='green', width=2),
-            hovertemplate='Year %{x}<br>Savings: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_expense_pie_fig(arrs):
+    # Create pie chart for first year expenses
+    # Mortgage is stored in a different column name than its category
+    expense_values = [arrs['Monthly_Mortgage'][0]] + [arrs[cat][0] for cat in expense_categories[1:]]
+
+    return go.Figure(
+        data=[go.Pie(
+            labels=expense_categories,
+            values=expense_values,
+            hole=.3,
+            hovertemplate='%{label}: %{value:,.0f} NOK (%{percent})<extra></extra>'
+        )],
+        layout=dict(
+            title='Current Monthly Expense Breakdown',
+            height=400
         )
     )
-    
-    # Customize layout
-    fig_overview.update_layout(
-        title='Monthly Financial Overview',
-        xaxis_title='Year',
-        yaxis_title='NOK per Month',
-        barmode='stack',
-        hovermode='x unified',
-        height=500
-    )
-    
-    st.plotly_chart(fig_overview, use_container_width=True)
-    
-    # Display summary data table
-    st.write("### Summary Data")
-    summary_df = df.select([
-        'Year', 
-        'Net_Monthly', 
-        'Monthly_Expenses', 
-        'Monthly_Mortgage', 
-        'Monthly_Savings',
-        'Remaining_Balance',
-        'Cumulative_Savings',
-        'Effective_Tax_Rate'
-    ])
-    
-    st.dataframe(summary_df.with_columns([
-        pl.col('Net_Monthly').round(0),
-        pl.col('Monthly_Expenses').round(0),
-        pl.col('Monthly_Mortgage').round(0),
-        pl.col('Monthly_Savings').round(0),
-        pl.col('Remaining_Balance').round(0),
-        pl.col('Cumulative_Savings').round(0),
-        pl.col('Effective_Tax_Rate').mul(100).round(1).alias('Effective_Tax_Rate (%)'),
-    ]))
-
-with tabs[1]:
-    # Income visualization
-    st.write("### Income Growth Over Time")
-    
-    # Create income visualization
-    fig_income = go.Figure()
-    
-    # Add gross salary
-    fig_income.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Gross_Salary'],
-            name='Gross Annual Salary',
-            line=dict(color='darkblue', width=2),
-            hovertemplate='Year %{x}<br>Gross Salary: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_expense_growth_fig(arrs):
+    year = arrs['Year']
+
+    return go.Figure(
+        # Mortgage is the first expense category, followed by a stacked bar for each of the others
+        data=[
+            go.Bar(
+                x=year,
+                y=arrs['Monthly_Mortgage'],
+                name='Mortgage',
+                hovertemplate='Year %{x}<br>Mortgage: %{y:,.0f} NOK<extra></extra>'
+            )
+        ] + [
+            go.Bar(
+                x=year,
+                y=arrs[category],
+                name=category,
+                hovertemplate='Year %{x}<br>' + category + ': %{y:,.0f} NOK<extra></extra>'
+            )
+            for category in expense_categories[1:]
+        ],
+        layout=dict(
+            title='Monthly Expenses Growth Over Time',
+            xaxis_title='Year',
+            yaxis_title='NOK per Month',
+            barmode='stack',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    # Add net salary
-    fig_income.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Net_Salary'],
-            name='Net Annual Salary',
-            line=dict(color='blue', width=2),
-            hovertemplate='Year %{x}<br>Net Salary: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_mortgage_fig(arrs):
+    year = arrs['Year']
+
+    # Create mortgage visualization
+    return go.Figure(
+        data=[
+            # Remaining balance line
+            go.Scatter(
+                x=year,
+                y=arrs['Remaining_Balance'],
+                mode='lines',
+                name='Remaining Balance',
+                line=dict(color='red', width=2),
+                hovertemplate='Year %{x}<br>Balance: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Principal and interest as stacked bars
+            go.Bar(
+                x=year,
+                y=arrs['Annual_Principal'],
+                name='Principal Payment',
+                marker_color='blue',
+                hovertemplate='Year %{x}<br>Principal: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Bar(
+                x=year,
+                y=arrs['Annual_Interest'],
+                name='Interest Payment',
+                marker_color='orange',
+                hovertemplate='Year %{x}<br>Interest: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Mortgage Amortization Schedule',
+            xaxis_title='Year',
+            yaxis_title='NOK',
+            barmode='stack',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    # Add real net salary
-    fig_income.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Real_Net_Salary'],
-            name='Real Net Salary (Inflation Adjusted)',
-            line=dict(color='lightblue', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Real Net Salary: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_savings_fig(arrs):
+    year = arrs['Year']
+
+    fig = go.Figure(
+        data=[
+            # Monthly savings potential
+            go.Scatter(
+                x=year,
+                y=arrs['Monthly_Savings'],
+                mode='lines',
+                name='Monthly Savings Potential',
+                line=dict(color='green', width=2),
+                hovertemplate='Year %{x}<br>Monthly Savings: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Real monthly savings
+            go.Scatter(
+                x=year,
+                y=arrs['Real_Monthly_Savings'],
+                mode='lines',
+                name='Real Monthly Savings (Inflation Adjusted)',
+                line=dict(color='green', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Real Monthly Savings: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Monthly Savings Potential Over Time',
+            xaxis_title='Year',
+            yaxis_title='NOK per Month',
+            hovermode='x unified',
+            height=400
         )
     )
-    
-    # Add tax as area
-    fig_income.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Gross_Salary']-df['Net_Salary'],
-            name='Tax Amount',
-            fill='tozeroy',
-            line=dict(color='red', width=0),
-            hovertemplate='Year %{x}<br>Tax: %{y:,.0f} NOK<extra></extra>'
+
+    # Add horizontal line at 0
+    fig.add_hline(y=0, line_dash="dash", line_color="red")
+
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def make_cumulative_fig(arrs):
+    year = arrs['Year']
+
+    return go.Figure(
+        data=[
+            # Nominal cumulative savings
+            go.Scatter(
+                x=year,
+                y=arrs['Cumulative_Savings'],
+                mode='lines',
+                name='Nominal Cumulative Savings',
+                fill='tozeroy',
+                line=dict(color='darkgreen', width=2),
+                hovertemplate='Year %{x}<br>Cumulative Savings: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Real cumulative savings
+            go.Scatter(
+                x=year,
+                y=arrs['Real_Cumulative_Savings'],
+                mode='lines',
+                name='Real Cumulative Savings (Inflation Adjusted)',
+                line=dict(color='darkgreen', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Real Cumulative Savings: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Cumulative Savings Potential Over 30 Years',
+            xaxis_title='Year',
+            yaxis_title='NOK',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    # Customize layout
-    fig_income.update_layout(
-        title='Annual Income Growth with Inflation Adjustment',
-        xaxis_title='Year',
-        yaxis_title='NOK per Year',
-        hovermode='x unified',
-        height=500
-    )
-    
-    st.plotly_chart(fig_income, use_container_width=True)
-    
-    # Show monthly income growth
-    fig_monthly_income = go.Figure()
-    
-    fig_monthly_income.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Net_Monthly'],
-            name='Nominal Net Monthly',
-            line=dict(color='blue', width=2),
-            hovertemplate='Year %{x}<br>Net Monthly: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_compound_fig(arrs, savings_return_rate):
+    year = arrs['Year']
+
+    # Calculate savings without compound interest for comparison
+    simple_cumulative = np.cumsum(arrs['Annual_Savings'])
+
+    return go.Figure(
+        data=[
+            # Compound savings line
+            go.Scatter(
+                x=year,
+                y=arrs['Cumulative_Savings'],
+                mode='lines',
+                name=f'With {savings_return_rate}% Return',
+                line=dict(color='darkgreen', width=2),
+                hovertemplate='Year %{x}<br>With Returns: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Simple savings line
+            go.Scatter(
+                x=year,
+                y=simple_cumulative,
+                mode='lines',
+                name='Without Investment Returns',
+                line=dict(color='lightgreen', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Without Returns: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Area representing the compound interest earned
+            go.Scatter(
+                x=year,
+                y=arrs['Cumulative_Savings'],
+                name='Compound Interest Earned',
+                fill='tonexty',
+                mode='none',
+                fillcolor='rgba(0, 100, 0, 0.2)',
+                hoverinfo='skip'
+            )
+        ],
+        layout=dict(
+            title='Effect of Compound Interest on Savings',
+            xaxis_title='Year',
+            yaxis_title='NOK',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    fig_monthly_income.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Real_Monthly_Income'],
-            name='Real Net Monthly (Inflation Adjusted)',
-            line=dict(color='blue', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Real Monthly: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_savings_rate_fig(arrs):
+    year = arrs['Year']
+
+    return go.Figure(
+        data=[
+            # Savings rate line
+            go.Scatter(
+                x=year,
+                y=arrs['Savings_Rate_Pct'],
+                mode='lines',
+                name='Savings Rate',
+                line=dict(color='purple', width=2),
+                hovertemplate='Year %{x}<br>Savings Rate: %{y:.1f}%<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Savings Rate (% of Net Income)',
+            xaxis_title='Year',
+            yaxis_title='Percentage',
+            hovermode='x unified',
+            height=300
         )
     )
-    
-    # Customize layout
-    fig_monthly_income.update_layout(
-        title='Monthly Income Growth (Nominal vs Real)',
-        xaxis_title='Year',
-        yaxis_title='NOK per Month',
-        hovermode='x unified',
-        height=400
-    )
-    
-    st.plotly_chart(fig_monthly_income, use_container_width=True)
 
-with tabs[2]:
-    # Expenses visualization
-    st.write("### Monthly Expenses Breakdown")
-    
-    # Create pie chart for first year expenses - fixing the column names
-    expense_categories = ['Mortgage', 'Joint Dept', 'Groceries', 'Utilities', 'Transportation', 'Entertainment', 'Other_Expenses']
-    expense_values = []
-    
-    # Add mortgage separately since it's stored in a different column name
-    expense_values.append(df['Monthly_Mortgage'][0])
-    
-    # Add the rest of the expense categories
-    for cat in expense_categories[1:]:
-        expense_values.append(df[cat][0])
-    
-    fig_expense_pie = go.Figure(data=[go.Pie(
-        labels=expense_categories,
-        values=expense_values,
-        hole=.3,
-        hovertemplate='%{label}: %{value:,.0f} NOK (%{percent})<extra></extra>'
-    )])
-    
-    fig_expense_pie.update_layout(
-        title='Current Monthly Expense Breakdown',
-        height=400
-    )
-    
-    st.plotly_chart(fig_expense_pie, use_container_width=True)
-    
-    # Show expense growth over time
-    st.write("### Expense Growth Over Time")
-    
-    fig_expense_growth = go.Figure()
-    
-    # Add mortgage as the first expense category
-    fig_expense_growth.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Monthly_Mortgage'],
-            name='Mortgage',
-            hovertemplate='Year %{x}<br>Mortgage: %{y:,.0f} NOK<extra></extra>'
+@st.cache_resource(show_spinner=False)
+def make_ppower_fig(arrs):
+    year = arrs['Year']
+
+    # Create purchasing power visualization
+    return go.Figure(
+        data=[
+            # Purchasing power line
+            go.Scatter(
+                x=year,
+                y=arrs['Inflation_Factor'] * 100,
+                mode='lines',
+                name='Purchasing Power',
+                line=dict(color='purple', width=2),
+                hovertemplate='Year %{x}<br>Purchasing Power: %{y:.1f}%<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Decline in Purchasing Power Over 30 Years',
+            xaxis_title='Year',
+            yaxis_title='Purchasing Power (% of Year 1)',
+            hovermode='x unified',
+            height=400,
+            yaxis=dict(range=[0, 100])
         )
     )
-    
-    # Add stacked bars for each expense category (excluding mortgage which we already added)
-    for category in expense_categories[1:]:
-        fig_expense_growth.add_trace(
-            go.Bar(
-                x=df['Year'],
-                y=df[category],
-                name=category,
-                hovertemplate='Year %{x}<br>' + category + ': %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_inflation_fig(arrs):
+    year = arrs['Year']
+
+    # Create inflation impact visualization; WebGL traces keep redraws off the SVG path.
+    # Traces and layout go into the constructor so the figure is assembled in one pass
+    # instead of being re-validated by add_trace/update_layout.
+    return go.Figure(
+        data=[
+            # Nominal and real income
+            go.Scattergl(
+                x=year,
+                y=arrs['Net_Monthly'],
+                mode='lines',
+                name='Nominal Net Income',
+                line=dict(color='blue', width=2),
+                hovertemplate='Year %{x}<br>Nominal Income: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Scattergl(
+                x=year,
+                y=arrs['Real_Monthly_Income'],
+                mode='lines',
+                name='Real Net Income',
+                line=dict(color='blue', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Real Income: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Nominal and real expenses
+            go.Scattergl(
+                x=year,
+                y=arrs['Monthly_Outflow'],
+                mode='lines',
+                name='Nominal Total Expenses',
+                line=dict(color='red', width=2),
+                hovertemplate='Year %{x}<br>Nominal Expenses: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Scattergl(
+                x=year,
+                y=arrs['Real_Monthly_Outflow'],
+                mode='lines',
+                name='Real Total Expenses',
+                line=dict(color='red', width=2, dash='dash'),
+                hovertemplate='Year %{x}<br>Real Expenses: %{y:,.0f} NOK<extra></extra>'
             )
+        ],
+        layout=dict(
+            title='Impact of Inflation on Income and Expenses',
+            xaxis_title='Year',
+            yaxis_title='NOK per Month',
+            hovermode='x unified',
+            height=500
         )
-    
-    # Customize layout
-    fig_expense_growth.update_layout(
-        title='Monthly Expenses Growth Over Time',
-        xaxis_title='Year',
-        yaxis_title='NOK per Month',
-        barmode='stack',
-        hovermode='x unified',
-        height=500
     )
-    
-    st.plotly_chart(fig_expense_growth, use_container_width=True)
-    
-    # Show expense table
-    st.write("### Monthly Expenses Data")
-    
-    # Create a copy of the DataFrame with a renamed column to match our categories
-    expense_cols = ['Year']
-    
-    # Add Monthly_Mortgage as the first expense column but name it 'Mortgage'
-    expense_df = df.select(['Year', 'Monthly_Mortgage'] + expense_categories[1:] + ['Monthly_Expenses'])
-    
-    # Rename the Monthly_Mortgage column to Mortgage to match our category name
-    expense_df = expense_df.rename({'Monthly_Mortgage': 'Mortgage'})
-    
-    # Display the DataFrame
-    st.dataframe(expense_df.with_columns([pl.col(col).round(0) for col in expense_df.columns if col != 'Year']))
 
-with tabs[3]:
-    # Mortgage visualizations
-    st.write("### Mortgage Amortization")
-    
-    # Create mortgage visualization
-    fig_mortgage = go.Figure()
-    
-    # Add remaining balance line
-    fig_mortgage.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Remaining_Balance'],
-            name='Remaining Balance',
-            line=dict(color='red', width=2),
-            hovertemplate='Year %{x}<br>Balance: %{y:,.0f} NOK<extra></extra>'
+@st.cache_resource(show_spinner=False)
+def make_tax_rate_fig(arrs):
+    year = arrs['Year']
+
+    # Create tax rate visualization
+    return go.Figure(
+        data=[
+            # Effective tax rate
+            go.Scatter(
+                x=year,
+                y=arrs['Effective_Tax_Rate'] * 100,
+                mode='lines',
+                name='Effective Tax Rate',
+                line=dict(color='red', width=2),
+                hovertemplate='Year %{x}<br>Effective Tax Rate: %{y:.1f}%<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Effective Tax Rate Over Time',
+            xaxis_title='Year',
+            yaxis_title='Tax Rate (%)',
+            hovermode='x unified',
+            height=400
         )
     )
-    
-    # Add principal and interest as stacked bars
-    fig_mortgage.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Annual_Principal'],
-            name='Principal Payment',
-            marker_color='blue',
-            hovertemplate='Year %{x}<br>Principal: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_tax_breakdown_fig(arrs):
+    year = arrs['Year']
+
+    # Create tax breakdown visualization
+    return go.Figure(
+        data=[
+            # Tax components as stacked bars
+            go.Bar(
+                x=year,
+                y=arrs['Income_Tax'],
+                name='Income Tax',
+                hovertemplate='Year %{x}<br>Income Tax: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Bar(
+                x=year,
+                y=arrs['Bracket_Tax'],
+                name='Bracket Tax',
+                hovertemplate='Year %{x}<br>Bracket Tax: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Bar(
+                x=year,
+                y=arrs['Social_Security'],
+                name='Social Security',
+                hovertemplate='Year %{x}<br>Social Security: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Bar(
+                x=year,
+                y=arrs['Municipal_Wealth_Tax'],
+                name='Municipal Wealth Tax',
+                hovertemplate='Year %{x}<br>Municipal Wealth Tax: %{y:,.0f} NOK<extra></extra>'
+            ),
+            go.Bar(
+                x=year,
+                y=arrs['State_Wealth_Tax'],
+                name='State Wealth Tax',
+                hovertemplate='Year %{x}<br>State Wealth Tax: %{y:,.0f} NOK<extra></extra>'
+            ),
+            # Interest deduction with negative value
+            go.Bar(
+                x=year,
+                y=arrs['Interest_Deduction'],
+                name='Interest Deduction',
+                marker_color='green',
+                hovertemplate='Year %{x}<br>Interest Deduction: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Tax Breakdown by Component',
+            xaxis_title='Year',
+            yaxis_title='NOK',
+            barmode='stack',
+            hovermode='x unified',
+            height=500
         )
     )
-    
-    fig_mortgage.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Annual_Interest'],
-            name='Interest Payment',
-            marker_color='orange',
-            hovertemplate='Year %{x}<br>Interest: %{y:,.0f} NOK<extra></extra>'
+
+@st.cache_resource(show_spinner=False)
+def make_total_tax_fig(arrs):
+    year = arrs['Year']
+
+    # Show total tax
+    return go.Figure(
+        data=[
+            go.Scatter(
+                x=year,
+                y=arrs['Total_Tax'],
+                mode='lines',
+                name='Total Tax',
+                line=dict(color='red', width=2),
+                hovertemplate='Year %{x}<br>Total Tax: %{y:,.0f} NOK<extra></extra>'
+            )
+        ],
+        layout=dict(
+            title='Total Tax Over Time',
+            xaxis_title='Year',
+            yaxis_title='NOK',
+            hovermode='x unified',
+            height=400
         )
     )
-    
-    # Customize layout
-    fig_mortgage.update_layout(
-        title='Mortgage Amortization Schedule',
-        xaxis_title='Year',
-        yaxis_title='NOK',
-        barmode='stack',
-        hovermode='x unified',
-        height=500
+
+# Table builders. The displayed tables are column selections of the projection, built once per projection.
+# Rounding is left to the display formats below, applied by st.dataframe at render time.
+WHOLE_NOK_COLUMNS = [
+    'Net_Monthly', 'Gross_Salary', 'Monthly_Expenses', 'Monthly_Mortgage', 'Mortgage', *EXPENSE_NAMES,
+    'Monthly_Savings', 'Annual_Principal', 'Annual_Interest', 'Annual_Mortgage', 'Remaining_Balance',
+    'Cumulative_Savings', 'Total_Tax', 'Income_Tax', 'Bracket_Tax', 'Social_Security', 'Interest_Deduction',
+    'Municipal_Wealth_Tax', 'State_Wealth_Tax', 'Current_Wealth'
+]
+TABLE_COLUMN_CONFIG = {
+    **{name: st.column_config.NumberColumn(format='%.0f') for name in WHOLE_NOK_COLUMNS},
+    'Effective_Tax_Rate (%)': st.column_config.NumberColumn(format='%.1f')
+}
+
+# The tables that add a derived column run as one lazy query, so the selection and the new
+# column are planned together instead of materializing the selection first
+@st.cache_data(show_spinner=False)
+def make_summary_table(df):
+    return (df.lazy()
+        .select([
+            'Year',
+            'Net_Monthly',
+            'Monthly_Expenses',
+            'Monthly_Mortgage',
+            'Monthly_Savings',
+            'Remaining_Balance',
+            'Cumulative_Savings',
+            'Effective_Tax_Rate'
+        ])
+        .with_columns(pl.col('Effective_Tax_Rate').mul(100).alias('Effective_Tax_Rate (%)'))
+        .collect()
     )
-    
-    st.plotly_chart(fig_mortgage, use_container_width=True)
-    
-    # Display mortgage data
-    st.write("### Mortgage Payment Breakdown")
-    
-    mortgage_info_df = df.select([
+
+@st.cache_data(show_spinner=False)
+def make_expense_table(df):
+    # Add Monthly_Mortgage as the first expense column but name it 'Mortgage' to match our categories
+    return (df
+        .select(['Year', 'Monthly_Mortgage'] + expense_categories[1:] + ['Monthly_Expenses'])
+        .rename({'Monthly_Mortgage': 'Mortgage'})
+    )
+
+@st.cache_data(show_spinner=False)
+def make_mortgage_table(df):
+    return df.select([
         'Year',
         'Monthly_Mortgage',
         'Annual_Principal',
@@ -748,550 +1006,242 @@ with tabs[3]:
         'Annual_Mortgage',
         'Remaining_Balance'
     ])
-    
-    st.dataframe(mortgage_info_df.with_columns([
-        pl.col('Monthly_Mortgage').round(0),
-        pl.col('Annual_Principal').round(0),
-        pl.col('Annual_Interest').round(0),
-        pl.col('Annual_Mortgage').round(0),
-        pl.col('Remaining_Balance').round(0)
-    ]))
-    
+
+@st.cache_data(show_spinner=False)
+def make_tax_table(df):
+    return (df.lazy()
+        .select([
+            'Year',
+            'Gross_Salary',
+            'Total_Tax',
+            'Effective_Tax_Rate',
+            'Income_Tax',
+            'Bracket_Tax',
+            'Social_Security',
+            'Interest_Deduction',
+            'Municipal_Wealth_Tax',
+            'State_Wealth_Tax',
+            'Current_Wealth'
+        ])
+        .with_columns(pl.col('Effective_Tax_Rate').mul(100).alias('Effective_Tax_Rate (%)'))
+        .collect()
+    )
+
+# Tab contents. Each view is a fragment, so interacting with one only reruns that view
+@st.fragment
+def overview_tab(df, arrs):
+    # Show key metrics for the first year
+    st.write("### Current Financial Snapshot (Year 1)")
+
+    row0 = df.row(0, named=True)
+
+    # First row - income and expenses
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Monthly Net Income", f"{row0['Net_Monthly']:,.0f} NOK")
+
+    with col2:
+        st.metric("Monthly Expenses", f"{row0['Monthly_Expenses']:,.0f} NOK")
+
+    with col3:
+        st.metric("Monthly Mortgage", f"{row0['Monthly_Mortgage']:,.0f} NOK")
+
+    with col4:
+        st.metric("Monthly Savings Potential", f"{row0['Monthly_Savings']:,.0f} NOK")
+
+    # Show overview of financial projection
+    st.write("### Financial Overview Over Time")
+
+    st.plotly_chart(make_overview_fig(arrs), use_container_width=True)
+
+    # Display summary data table
+    st.write("### Summary Data")
+    st.dataframe(make_summary_table(df), column_config=TABLE_COLUMN_CONFIG)
+
+@st.fragment
+def income_tab(arrs):
+    # Income visualization
+    st.write("### Income Growth Over Time")
+
+    st.plotly_chart(make_income_fig(arrs), use_container_width=True)
+
+    st.plotly_chart(make_monthly_income_fig(arrs), use_container_width=True)
+
+@st.fragment
+def expenses_tab(df, arrs):
+    # Expenses visualization
+    st.write("### Monthly Expenses Breakdown")
+
+    st.plotly_chart(make_expense_pie_fig(arrs), use_container_width=True)
+
+    # Show expense growth over time
+    st.write("### Expense Growth Over Time")
+
+    st.plotly_chart(make_expense_growth_fig(arrs), use_container_width=True)
+
+    # Show expense table
+    st.write("### Monthly Expenses Data")
+
+    st.dataframe(make_expense_table(df), column_config=TABLE_COLUMN_CONFIG)
+
+@st.fragment
+def mortgage_tab(df, arrs):
+    # Mortgage visualizations
+    st.write("### Mortgage Amortization")
+
+    st.plotly_chart(make_mortgage_fig(arrs), use_container_width=True)
+
+    # Display mortgage data
+    st.write("### Mortgage Payment Breakdown")
+
+    st.dataframe(make_mortgage_table(df), column_config=TABLE_COLUMN_CONFIG)
+
     # Calculate total interest vs principal
-    total_principal = df['Annual_Principal'].sum()
-    total_interest = df['Annual_Interest'].sum()
+    total_principal = arrs['Annual_Principal'].sum()
+    total_interest = arrs['Annual_Interest'].sum()
     total_paid = total_principal + total_interest
-    
+
     # Display mortgage summary metrics
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
         st.metric('Total Principal Paid', f'{total_principal:,.0f} NOK')
-    
+
     with col2:
         st.metric('Total Interest Paid', f'{total_interest:,.0f} NOK')
-    
+
     with col3:
         st.metric('Interest as % of Payments', f'{(total_interest/total_paid*100):.1f}%')
 
-with tabs[4]:
+@st.fragment
+def savings_tab(arrs, savings_return_rate):
     # Savings visualization
     st.write("### Monthly Savings Potential")
-    
-    fig_savings = go.Figure()
-    
-    # Add monthly savings potential
-    fig_savings.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Monthly_Savings'],
-            name='Monthly Savings Potential',
-            line=dict(color='green', width=2),
-            hovertemplate='Year %{x}<br>Monthly Savings: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Add real monthly savings
-    fig_savings.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Real_Monthly_Savings'],
-            name='Real Monthly Savings (Inflation Adjusted)',
-            line=dict(color='green', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Real Monthly Savings: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Add horizontal line at 0
-    fig_savings.add_hline(y=0, line_dash="dash", line_color="red")
-    
-    # Customize layout
-    fig_savings.update_layout(
-        title='Monthly Savings Potential Over Time',
-        xaxis_title='Year',
-        yaxis_title='NOK per Month',
-        hovermode='x unified',
-        height=400
-    )
-    
-    st.plotly_chart(fig_savings, use_container_width=True)
-    
+
+    st.plotly_chart(make_savings_fig(arrs), use_container_width=True)
+
     # Cumulative savings visualization
     st.write("### Cumulative Savings Potential")
     st.write(f"With {savings_return_rate}% annual return on investments")
 
-    fig_cumulative = go.Figure()
-
-    # Add nominal cumulative savings
-    fig_cumulative.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Cumulative_Savings'],
-            name='Nominal Cumulative Savings',
-            fill='tozeroy',
-            line=dict(color='darkgreen', width=2),
-            hovertemplate='Year %{x}<br>Cumulative Savings: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
+    st.plotly_chart(make_cumulative_fig(arrs), use_container_width=True)
 
-    # Add real cumulative savings
-    fig_cumulative.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Real_Cumulative_Savings'],
-            name='Real Cumulative Savings (Inflation Adjusted)',
-            line=dict(color='darkgreen', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Real Cumulative Savings: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-
-    # Customize layout
-    fig_cumulative.update_layout(
-        title='Cumulative Savings Potential Over 30 Years',
-        xaxis_title='Year',
-        yaxis_title='NOK',
-        hovermode='x unified',
-        height=500
-    )
-    
-    st.plotly_chart(fig_cumulative, use_container_width=True)
-    
     # Create a visualization of compound interest effect
     st.write("### Impact of Compound Interest on Savings")
 
-    # Calculate savings without compound interest for comparison
-    simple_cumulative = []
-    running_total = 0
-    for annual_saving in df['Annual_Savings']:
-        running_total += annual_saving
-        simple_cumulative.append(running_total)
-
-    fig_compound = go.Figure()
-
-    # Add compound savings line
-    fig_compound.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Cumulative_Savings'],
-            name=f'With {savings_return_rate}% Return',
-            line=dict(color='darkgreen', width=2),
-            hovertemplate='Year %{x}<br>With Returns: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-
-    # Add simple savings line
-    fig_compound.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=simple_cumulative,
-            name='Without Investment Returns',
-            line=dict(color='lightgreen', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Without Returns: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-
-    # Add area representing the compound interest earned
-    fig_compound.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Cumulative_Savings'],
-            name='Compound Interest Earned',
-            fill='tonexty',
-            mode='none',
-            fillcolor='rgba(0, 100, 0, 0.2)',
-            hoverinfo='skip'
-        )
-    )
-
-    # Customize layout
-    fig_compound.update_layout(
-        title='Effect of Compound Interest on Savings',
-        xaxis_title='Year',
-        yaxis_title='NOK',
-        hovermode='x unified',
-        height=500
-    )
-
-    st.plotly_chart(fig_compound, use_container_width=True)
+    st.plotly_chart(make_compound_fig(arrs, savings_return_rate), use_container_width=True)
 
     # Savings rate visualization
     st.write("### Savings Rate")
-    
-    fig_savings_rate = go.Figure()
-    
-    # Calculate savings rate as percentage of net income
-    savings_rate = [(df['Monthly_Savings'][i] / df['Net_Monthly'][i]) * 100 for i in range(len(df))]
-    
-    # Add savings rate line
-    fig_savings_rate.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=savings_rate,
-            name='Savings Rate',
-            line=dict(color='purple', width=2),
-            hovertemplate='Year %{x}<br>Savings Rate: %{y:.1f}%<extra></extra>'
-        )
-    )
-    
-    # Customize layout
-    fig_savings_rate.update_layout(
-        title='Savings Rate (% of Net Income)',
-        xaxis_title='Year',
-        yaxis_title='Percentage',
-        hovermode='x unified',
-        height=300
-    )
-    
-    st.plotly_chart(fig_savings_rate, use_container_width=True)
 
-with tabs[5]:
+    st.plotly_chart(make_savings_rate_fig(arrs), use_container_width=True)
+
+@st.fragment
+def inflation_tab(arrs, inflation_rate, cost_of_living_increase):
     # Inflation impact
     st.write("### Impact of Inflation Over Time")
     st.write(f"Assuming an annual inflation rate of {inflation_rate}% and cost of living increase of {cost_of_living_increase}%")
-    
-    # Create purchasing power visualization
-    fig_ppower = go.Figure()
-    
-    # Add purchasing power line
-    fig_ppower.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Inflation_Factor'] * 100,
-            name='Purchasing Power',
-            line=dict(color='purple', width=2),
-            hovertemplate='Year %{x}<br>Purchasing Power: %{y:.1f}%<extra></extra>'
-        )
-    )
-    
-    # Customize layout
-    fig_ppower.update_layout(
-        title='Decline in Purchasing Power Over 30 Years',
-        xaxis_title='Year',
-        yaxis_title='Purchasing Power (% of Year 1)',
-        hovermode='x unified',
-        height=400,
-        yaxis=dict(range=[0, 100])
-    )
-    
-    st.plotly_chart(fig_ppower, use_container_width=True)
-    
-    # Create inflation impact visualization
-    fig_inflation = go.Figure()
-    
-    # Add nominal and real income
-    fig_inflation.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Net_Monthly'],
-            name='Nominal Net Income',
-            line=dict(color='blue', width=2),
-            hovertemplate='Year %{x}<br>Nominal Income: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    fig_inflation.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Real_Monthly_Income'],
-            name='Real Net Income',
-            line=dict(color='blue', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Real Income: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Add nominal and real expenses
-    total_monthly_outflow = [df['Monthly_Expenses'][i] + df['Monthly_Mortgage'][i] for i in range(len(df))]
-    total_real_monthly_outflow = [df['Real_Monthly_Expenses'][i] + df['Real_Monthly_Mortgage'][i] for i in range(len(df))]
-    
-    fig_inflation.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=total_monthly_outflow,
-            name='Nominal Total Expenses',
-            line=dict(color='red', width=2),
-            hovertemplate='Year %{x}<br>Nominal Expenses: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    fig_inflation.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=total_real_monthly_outflow,
-            name='Real Total Expenses',
-            line=dict(color='red', width=2, dash='dash'),
-            hovertemplate='Year %{x}<br>Real Expenses: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Customize layout
-    fig_inflation.update_layout(
-        title='Impact of Inflation on Income and Expenses',
-        xaxis_title='Year',
-        yaxis_title='NOK per Month',
-        hovermode='x unified',
-        height=500
-    )
-    
-    st.plotly_chart(fig_inflation, use_container_width=True)
 
-# Add new Tax tab
-with tabs[6]:
+    st.plotly_chart(make_ppower_fig(arrs), use_container_width=True)
+
+    st.plotly_chart(make_inflation_fig(arrs), use_container_width=True)
+
+@st.fragment
+def taxes_tab(df, arrs):
     # Tax visualizations
     st.write("### Tax Rate Over Time")
-    
-    # Create tax rate visualization
-    fig_tax_rate = go.Figure()
-    
-    # Add effective tax rate
-    fig_tax_rate.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Effective_Tax_Rate'] * 100,
-            name='Effective Tax Rate',
-            line=dict(color='red', width=2),
-            hovertemplate='Year %{x}<br>Effective Tax Rate: %{y:.1f}%<extra></extra>'
-        )
-    )
-    
-    # Customize layout
-    fig_tax_rate.update_layout(
-        title='Effective Tax Rate Over Time',
-        xaxis_title='Year',
-        yaxis_title='Tax Rate (%)',
-        hovermode='x unified',
-        height=400
-    )
-    
-    st.plotly_chart(fig_tax_rate, use_container_width=True)
-    
+
+    st.plotly_chart(make_tax_rate_fig(arrs), use_container_width=True)
+
     # Show tax breakdown
     st.write("### Tax Breakdown by Component")
-    
-    # Create tax breakdown visualization
-    fig_tax_breakdown = go.Figure()
-    
-    # Add tax components as stacked bars
-    fig_tax_breakdown.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Income_Tax'],
-            name='Income Tax',
-            hovertemplate='Year %{x}<br>Income Tax: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    fig_tax_breakdown.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Bracket_Tax'],
-            name='Bracket Tax',
-            hovertemplate='Year %{x}<br>Bracket Tax: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    fig_tax_breakdown.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Social_Security'],
-            name='Social Security',
-            hovertemplate='Year %{x}<br>Social Security: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    fig_tax_breakdown.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Municipal_Wealth_Tax'],
-            name='Municipal Wealth Tax',
-            hovertemplate='Year %{x}<br>Municipal Wealth Tax: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    fig_tax_breakdown.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['State_Wealth_Tax'],
-            name='State Wealth Tax',
-            hovertemplate='Year %{x}<br>State Wealth Tax: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Add interest deduction with negative value
-    fig_tax_breakdown.add_trace(
-        go.Bar(
-            x=df['Year'],
-            y=df['Interest_Deduction'],
-            name='Interest Deduction',
-            marker_color='green',
-            hovertemplate='Year %{x}<br>Interest Deduction: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Customize layout
-    fig_tax_breakdown.update_layout(
-        title='Tax Breakdown by Component',
-        xaxis_title='Year',
-        yaxis_title='NOK',
-        barmode='stack',
-        hovermode='x unified',
-        height=500
-    )
-    
-    st.plotly_chart(fig_tax_breakdown, use_container_width=True)
-    
-    # Show total tax
-    fig_total_tax = go.Figure()
-    
-    fig_total_tax.add_trace(
-        go.Scatter(
-            x=df['Year'],
-            y=df['Total_Tax'],
-            name='Total Tax',
-            line=dict(color='red', width=2),
-            hovertemplate='Year %{x}<br>Total Tax: %{y:,.0f} NOK<extra></extra>'
-        )
-    )
-    
-    # Customize layout
-    fig_total_tax.update_layout(
-        title='Total Tax Over Time',
-        xaxis_title='Year',
-        yaxis_title='NOK',
-        hovermode='x unified',
-        height=400
-    )
-    
-    st.plotly_chart(fig_total_tax, use_container_width=True)
-    
+
+    st.plotly_chart(make_tax_breakdown_fig(arrs), use_container_width=True)
+
+    st.plotly_chart(make_total_tax_fig(arrs), use_container_width=True)
+
     # Display tax data
     st.write("### Tax Data")
-    
-    tax_df = df.select([
-        'Year',
-        'Gross_Salary',
-        'Total_Tax',
-        'Effective_Tax_Rate',
-        'Income_Tax',
-        'Bracket_Tax',
-        'Social_Security',
-        'Interest_Deduction',
-        'Municipal_Wealth_Tax',
-        'State_Wealth_Tax',
-        'Current_Wealth'
-    ])
-    
-    st.dataframe(tax_df.with_columns([
-        pl.col('Gross_Salary').round(0),
-        pl.col('Total_Tax').round(0),
-        pl.col('Effective_Tax_Rate').mul(100).round(1).alias('Effective_Tax_Rate (%)'),
-        pl.col('Income_Tax').round(0),
-        pl.col('Bracket_Tax').round(0),
-        pl.col('Social_Security').round(0),
-        pl.col('Interest_Deduction').round(0),
-        pl.col('Municipal_Wealth_Tax').round(0),
-        pl.col('State_Wealth_Tax').round(0),
-        pl.col('Current_Wealth').round(0)
-    ]))
-
-# Summary metrics
-st.subheader('Financial Summary')
-
-# First row - Current situation (Year 1)
-st.write("### Current Financial Situation (Year 1)")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric(
-        'Net Monthly Income', 
-        f'{df["Net_Monthly"][0]:,.0f} NOK'
-    )
-    
-with col2:
-    st.metric(
-        'Total Monthly Expenses', 
-        f'{df["Monthly_Expenses"][0] + df["Monthly_Mortgage"][0]:,.0f} NOK',
-        help='Includes both living expenses and mortgage payment'
-    )
-    
-with col3:
-    st.metric(
-        'Monthly Savings Potential', 
-        f'{df["Monthly_Savings"][0]:,.0f} NOK'
-    )
-    
-with col4:
-    st.metric(
-        'Effective Tax Rate', 
-        f'{df["Effective_Tax_Rate"][0]*100:.1f}%',
-        help='Calculated based on Norwegian tax system'
-    )
 
-# Second row - End of period projection (Year 30)
-st.write("### Financial Projection (Year 30)")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    nominal_end_income = df["Net_Monthly"].tail(1)[0]
-    real_end_income = df["Real_Monthly_Income"].tail(1)[0]
-    st.metric(
-        'Net Monthly Income', 
-        f'{nominal_end_income:,.0f} NOK',
-        delta=f'Real: {real_end_income:,.0f} NOK'
-    )
-    
-with col2:
-    end_expenses = df["Monthly_Expenses"].tail(1)[0] + df["Monthly_Mortgage"].tail(1)[0]
-    st.metric(
-        'Total Monthly Expenses', 
-        f'{end_expenses:,.0f} NOK'
-    )
-    
-with col3:
-    end_savings = df["Monthly_Savings"].tail(1)[0]
-    real_end_savings = df["Real_Monthly_Savings"].tail(1)[0]
-    st.metric(
-        'Monthly Savings Potential', 
-        f'{end_savings:,.0f} NOK',
-        delta=f'Real: {real_end_savings:,.0f} NOK'
-    )
-    
-with col4:
-    end_power = df["Inflation_Factor"].tail(1)[0] * 100
-    st.metric(
-        'Purchasing Power', 
-        f'{end_power:.1f}%',
-        delta=f'-{100-end_power:.1f}%',
-        delta_color='inverse'
-    )
+    st.dataframe(make_tax_table(df), column_config=TABLE_COLUMN_CONFIG)
 
-# Third row - Lifetime totals
-st.write("### Lifetime Totals (30 Years)")
-col1, col2, col3, col4 = st.columns(4)
+# Display the selected view. Unlike st.tabs, which runs every tab on each rerun,
+# only the chosen view's charts and tables are built and sent to the browser
+st.subheader('Financial Projections Over 30 Years')
+view = st.radio(
+    'View',
+    ['Overview', 'Income', 'Expenses', 'Mortgage', 'Savings', 'Inflation Impact', 'Taxes'],
+    horizontal=True,
+    label_visibility='collapsed'
+)
 
-with col1:
-    st.metric(
-        'Total Net Income', 
-        f'{df["Net_Salary"].sum():,.0f} NOK'
-    )
-    
-with col2:
-    st.metric(
-        'Total Mortgage Payments', 
-        f'{df["Annual_Mortgage"].sum():,.0f} NOK'
-    )
-    
-with col3:
-    st.metric(
-        'Total Living Expenses', 
-        f'{df["Annual_Expenses"].sum():,.0f} NOK'
+if view == 'Overview':
+    overview_tab(df, arrs)
+elif view == 'Income':
+    income_tab(arrs)
+elif view == 'Expenses':
+    expenses_tab(df, arrs)
+elif view == 'Mortgage':
+    mortgage_tab(df, arrs)
+elif view == 'Savings':
+    savings_tab(arrs, savings_return_rate)
+elif view == 'Inflation Impact':
+    inflation_tab(arrs, inflation_rate, cost_of_living_increase)
+elif view == 'Taxes':
+    taxes_tab(df, arrs)
+
+# Summary metrics. Rendered as a fragment like the tabs, so it reruns on its own
+@st.fragment
+def summary_section(df, stats):
+    st.subheader('Financial Summary')
+
+    # Pull the first and last projection years once; lifetime figures come precomputed in stats
+    first = df.row(0, named=True)
+    last = df.row(-1, named=True)
+
+    # Render every figure in one pre-formatted table instead of a grid of separate metric widgets
+    summary_table = pl.DataFrame({
+        'Metric': [
+            'Net Monthly Income',
+            'Total Monthly Expenses',
+            'Monthly Savings Potential',
+            'Effective Tax Rate',
+            'Purchasing Power',
+            'Total Net Income',
+            'Total Mortgage Payments',
+            'Total Living Expenses',
+            'Total Potential Savings'
+        ],
+        'Year 1': [
+            f'{first["Net_Monthly"]:,.0f} NOK',
+            f'{first["Monthly_Outflow"]:,.0f} NOK',
+            f'{first["Monthly_Savings"]:,.0f} NOK',
+            f'{first["Effective_Tax_Rate"]*100:.1f}%',
+            '', '', '', '', ''
+        ],
+        'Year 30': [
+            f'{last["Net_Monthly"]:,.0f} NOK (real: {last["Real_Monthly_Income"]:,.0f} NOK)',
+            f'{last["Monthly_Outflow"]:,.0f} NOK',
+            f'{last["Monthly_Savings"]:,.0f} NOK (real: {last["Real_Monthly_Savings"]:,.0f} NOK)',
+            '',
+            f'{stats["End_Power"]:.1f}% (↓ {100-stats["End_Power"]:.1f}%)',
+            '', '', '', ''
+        ],
+        'Lifetime (30 Years)': [
+            '', '', '', '', '',
+            f'{stats["Total_Net_Income"]:,.0f} NOK',
+            f'{stats["Total_Mortgage"]:,.0f} NOK',
+            f'{stats["Total_Expenses"]:,.0f} NOK',
+            f'{last["Cumulative_Savings"]:,.0f} NOK (↑ {stats["Compound_Gain"]:,.0f} NOK from returns)'
+        ]
+    })
+    st.dataframe(summary_table, hide_index=True, use_container_width=True)
+
+    st.caption(
+        'Total monthly expenses include both living expenses and mortgage payment. '
+        'The effective tax rate is calculated based on the Norwegian tax system. '
+        f'Total potential savings include a {stats["Compound_Percentage"]:.1f}% gain from compound interest.'
     )
-    
-with col4:
-    compound_gain = df["Cumulative_Savings"].tail(1)[0] - sum(df["Annual_Savings"])
-    compound_percentage = (compound_gain / sum(df["Annual_Savings"])) * 100 if sum(df["Annual_Savings"]) > 0 else 0
-    st.metric(
-        'Total Potential Savings', 
-        f'{df["Cumulative_Savings"].tail(1)[0]:,.0f} NOK',
-        delta=f'+{compound_gain:,.0f} NOK from returns',
-        help=f'Includes {compound_percentage:.1f}% gain from compound interest'
-    ) 
\ No newline at end of file
+
+summary_section(df, stats)
@@ -1,9 +1,118 @@
+from collections import namedtuple
+from dataclasses import dataclass, field
+
+import numpy as np
 import polars as pl
 
-def calculate_norwegian_tax(income, wealth, loans=0, mortgage=0, year=2025, primary_home_value=0, bank_balance=0, income_type='wage', 
-                            mortgage_interest_rate=0.04, other_loans_interest_rate=0.06):
+# Scalar tax figures for one taxpayer, as returned by calculate_tax_result
+TaxResult = namedtuple('TaxResult', [
+    'income_tax', 'bracket_tax', 'social_security', 'interest_deduction', 'municipal_wealth_tax',
+    'state_wealth_tax', 'total_tax', 'effective_tax_rate', 'mortgage_interest', 'other_loans_interest',
+    'total_interest', 'total_debt', 'net_wealth_for_tax'
+])
+
+def _marginal_deltas(thresholds):
+    """Turn (threshold, marginal rate) pairs into (threshold, rate increase) pairs."""
+    previous_rates = (0,) + tuple(rate for _, rate in thresholds[:-1])
+    return tuple((threshold, rate - previous) for (threshold, rate), previous in zip(thresholds, previous_rates))
+
+
+@dataclass(frozen=True)
+class TaxParams:
+    """Rates, deductions and thresholds for one tax year."""
+    # Tax on ordinary income (alminnelig inntekt)
+    income_tax_rate: float
+    # Personal deduction (personfradrag)
+    personal_deduction: float
+    # Social security contribution (trygdeavgift) by income type
+    social_security_rates: dict
+    # Bracket tax (trinnskatt) (threshold, rate) pairs, lowest first
+    bracket_tax_thresholds: tuple
+    # Wealth tax (formuesskatt) threshold
+    wealth_tax_threshold: float
+    # Municipal wealth tax rate
+    municipal_wealth_tax_rate: float
+    # State wealth tax (threshold, rate) pairs, lowest first
+    state_wealth_tax_thresholds: tuple
+    # Share of market value that counts as wealth for primary and secondary homes
+    primary_home_value_reduction: float
+    secondary_home_value_reduction: float
+    # Progressive tables as (threshold, rate increase over the previous bracket) pairs, so a tax is
+    # sum(max(0, amount - threshold) * increase) with no walk through the brackets
+    bracket_tax_deltas: tuple = field(init=False)
+    state_wealth_tax_deltas: tuple = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'bracket_tax_deltas', _marginal_deltas(self.bracket_tax_thresholds[1:]))
+        object.__setattr__(self, 'state_wealth_tax_deltas', _marginal_deltas(self.state_wealth_tax_thresholds))
+
+
+# Tax parameters per supported year, built once at import
+_TAX_PARAMS = {
+    2025: TaxParams(
+        income_tax_rate=0.22,  # 22% flat rate
+        personal_deduction=79_200,  # NOK
+        social_security_rates={
+            'wage': 0.080,            # 8.0% for wage income
+            'self_employment': 0.112, # 11.2% for self-employment income
+            'pension': 0.051          # 5.1% for pension income
+        },
+        # Bracket tax thresholds and rates - corrected from regjeringen.no
+        bracket_tax_thresholds=(
+            (0, 0),
+            (217_400, 0.017),  # 1.7% - Trinn 1
+            (306_050, 0.040),  # 4.0% - Trinn 2 
+            (697_150, 0.137),  # 13.7% - Trinn 3
+            (942_400, 0.167),  # 16.7% - Trinn 4
+            (1_410_750, 0.177), # 17.7% - Trinn 5
+        ),
+        # Wealth tax parameters - corrected from regjeringen.no
+        wealth_tax_threshold=1_760_000,  # NOK
+        municipal_wealth_tax_rate=0.007,  # 0.7%
+        state_wealth_tax_thresholds=(
+            (1_760_000, 0.00525),  # 0.525% for wealth above 1,760,000
+            (20_070_000, 0.01),    # Additional 1.0% for wealth above 20,070,000
+        ),
+        primary_home_value_reduction=0.25,  # Primary homes are valued at 25% of market value
+        secondary_home_value_reduction=0.95  # Secondary homes are valued at 95% of market value
+    ),
+    2024: TaxParams(
+        income_tax_rate=0.22,  # 22% flat rate
+        personal_deduction=77_700,  # NOK
+        social_security_rates={
+            'wage': 0.080,            # 8.0% for wage income
+            'self_employment': 0.112, # 11.2% for self-employment income
+            'pension': 0.051          # 5.1% for pension income
+        },
+        # Bracket tax thresholds and rates - verified from regjeringen.no
+        bracket_tax_thresholds=(
+            (0, 0),
+            (208_050, 0.017),  # 1.7% tax for income above 208,050
+            (293_250, 0.040),  # 4.0% tax for income above 293,250
+            (667_650, 0.137),  # 13.7% tax for income above 667,650
+            (902_300, 0.167),  # 16.7% tax for income above 902,300
+            (1_350_000, 0.177), # 17.7% tax for income above 1,350,000
+        ),
+        # Wealth tax parameters - verified from regjeringen.no
+        wealth_tax_threshold=1_700_000,  # NOK
+        municipal_wealth_tax_rate=0.007,  # 0.7%
+        state_wealth_tax_thresholds=(
+            (1_700_000, 0.00525),  # 0.525% for wealth above 1,700,000
+            (19_970_000, 0.01),    # Additional 1.0% for wealth above 19,970,000
+        ),
+        primary_home_value_reduction=0.25,  # Primary homes are valued at 25% of market value
+        secondary_home_value_reduction=0.95  # Secondary homes are valued at 95% of market value
+    ),
+}
+
+
+def calculate_tax_result(income, wealth, loans=0, mortgage=0, year=2025, primary_home_value=0, bank_balance=0, income_type='wage', 
+                         mortgage_interest_rate=0.04, other_loans_interest_rate=0.06):
     """
-    Calculate Norwegian taxes based on income and wealth, accounting for loans and mortgages.
+    Calculate Norwegian taxes for one taxpayer and return the figures as a TaxResult.
+
+    Same inputs and arithmetic as calculate_norwegian_tax, but without building the nested
+    result dicts, for callers that evaluate many scenarios in a loop.
     
     Parameters:
     -----------
@@ -30,8 +139,8 @@ def calculate_norwegian_tax(income, wealth, loans=0, mortgage=0, year=2025, prim
         
     Returns:
     --------
-    dict
-        Dictionary containing tax details
+    TaxResult
+        Tax components, totals, interest and net wealth for tax purposes
     """
     # Validate inputs
     if income < 0:
@@ -53,203 +162,274 @@ def calculate_norwegian_tax(income, wealth, loans=0, mortgage=0, year=2025, prim
     if income_type not in ['wage', 'self_employment', 'pension']:
         raise ValueError(f'Income type {income_type} is not supported. Use "wage", "self_employment", or "pension".')
     
-    result = {
-        'income': income,
-        'gross_wealth': wealth,
-        'loans': loans,
-        'mortgage': mortgage,
-        'primary_home_value': primary_home_value,
-        'bank_balance': bank_balance,
-        'income_type': income_type,
-        'year': year,
-        'tax_components': {}
-    }
-    
     # Income tax parameters
-    if year == 2025:
-        # Tax on ordinary income (alminnelig inntekt)
-        income_tax_rate = 0.22  # 22% flat rate
-
-        # Personal deduction (personfradrag)
-        personal_deduction = 79_200  # NOK
-        
-        # Social security contribution (trygdeavgift)
-        social_security_rates = {
-            'wage': 0.080,            # 8.0% for wage income
-            'self_employment': 0.112, # 11.2% for self-employment income
-            'pension': 0.051          # 5.1% for pension income
-        }
-        
-        # Bracket tax (trinnskatt) thresholds and rates - corrected from regjeringen.no
-        bracket_tax_thresholds = [
-            (0, 0),
-            (217_400, 0.017),  # 1.7% - Trinn 1
-            (306_050, 0.040),  # 4.0% - Trinn 2 
-            (697_150, 0.137),  # 13.7% - Trinn 3
-            (942_400, 0.167),  # 16.7% - Trinn 4
-            (1_410_750, 0.177), # 17.7% - Trinn 5
-        ]
-        
-        # Wealth tax (formuesskatt) parameters - corrected from regjeringen.no
-        # Wealth tax threshold
-        wealth_tax_threshold = 1_760_000  # NOK
-        
-        # Municipal wealth tax
-        municipal_wealth_tax_rate = 0.007  # 0.7%
-        
-        # State wealth tax
-        state_wealth_tax_thresholds = [
-            (1_760_000, 0.00525),  # 0.525% for wealth above 1,760,000
-            (20_070_000, 0.01),    # Additional 1.0% for wealth above 20,070,000
-        ]
-        
-        # Primary home value reduction
-        primary_home_value_reduction = 0.25  # Primary homes are valued at 25% of market value
-        
-        # Secondary homes value reduction
-        secondary_home_value_reduction = 0.95  # Secondary homes are valued at 95% of market value
-        
-        # Interest deduction rate on ordinary income
-        interest_deduction_rate = 0.22  # 22% tax deduction on interest paid
-    
-    elif year == 2024:
-        # Tax on ordinary income (alminnelig inntekt)
-        income_tax_rate = 0.22  # 22% flat rate
-
-        # Personal deduction (personfradrag)
-        personal_deduction = 77_700  # NOK
-        
-        # Social security contribution (trygdeavgift)
-        social_security_rates = {
-            'wage': 0.080,            # 8.0% for wage income
-            'self_employment': 0.112, # 11.2% for self-employment income
-            'pension': 0.051          # 5.1% for pension income
-        }
-        
-        # Bracket tax (trinnskatt) thresholds and rates - verified from regjeringen.no
-        bracket_tax_thresholds = [
-            (0, 0),
-            (208_050, 0.017),  # 1.7% tax for income above 208,050
-            (293_250, 0.040),  # 4.0% tax for income above 293,250
-            (667_650, 0.137),  # 13.7% tax for income above 667,650
-            (902_300, 0.167),  # 16.7% tax for income above 902,300
-            (1_350_000, 0.177), # 17.7% tax for income above 1,350,000
-        ]
-        
-        # Wealth tax (formuesskatt) parameters - verified from regjeringen.no
-        # Wealth tax threshold
-        wealth_tax_threshold = 1_700_000  # NOK
-        
-        # Municipal wealth tax
-        municipal_wealth_tax_rate = 0.007  # 0.7%
-        
-        # State wealth tax
-        state_wealth_tax_thresholds = [
-            (1_700_000, 0.00525),  # 0.525% for wealth above 1,700,000
-            (19_970_000, 0.01),    # Additional 1.0% for wealth above 19,970,000
-        ]
-        
-        # Primary home value reduction
-        primary_home_value_reduction = 0.25  # Primary homes are valued at 25% of market value
-        
-        # Secondary homes value reduction
-        secondary_home_value_reduction = 0.95  # Secondary homes are valued at 95% of market value
-        
-        # Interest deduction rate on ordinary income
-        interest_deduction_rate = 0.22  # 22% tax deduction on interest paid
+    params = _TAX_PARAMS[year]
 
     # Calculate total debt
     total_debt = loans + mortgage
-    result['total_debt'] = total_debt
-    
-    # Calculate the taxable value of the primary home
-    taxable_primary_home_value = 0
-    if primary_home_value > 0:
-        # For primary homes, only a portion of the value is taxable
-        # Different rates for value above 10 million
-        if primary_home_value <= 10_000_000:
-            taxable_primary_home_value = primary_home_value * primary_home_value_reduction
-        else:
-            # 25% for first 10 million, 50% for amount above 10 million
-            taxable_primary_home_value = (10_000_000 * primary_home_value_reduction) + ((primary_home_value - 10_000_000) * 0.5)
     
     # Calculate net wealth for tax purposes
     # Wealth - debt (all debts reduce taxable wealth)
     net_wealth_for_tax = max(0, wealth - total_debt)
-    result['net_wealth_for_tax'] = net_wealth_for_tax
     
     # Calculate interest expense (based on provided rates)
     mortgage_interest = mortgage * mortgage_interest_rate
     other_loans_interest = loans * other_loans_interest_rate
     total_interest = mortgage_interest + other_loans_interest
     
-    # Store interest calculations in result
-    result['interest'] = {
-        'mortgage_interest_rate': mortgage_interest_rate,
-        'other_loans_interest_rate': other_loans_interest_rate,
-        'mortgage_interest': mortgage_interest,
-        'other_loans_interest': other_loans_interest,
-        'total_interest': total_interest
-    }
+    # Calculate income tax (skatt på alminnelig inntekt) on income after the personal deduction
+    ordinary_income = max(0, income - params.personal_deduction)
+    income_tax = ordinary_income * params.income_tax_rate
     
-    # Calculate interest deduction (tax savings from interest expenses)
-    interest_deduction = total_interest * interest_deduction_rate
-    result['tax_components']['interest_deduction'] = -interest_deduction  # Negative as it reduces tax
+    # Calculate interest deduction, negative as it reduces tax
+    # Interest is deductible from ordinary income, so it saves income tax on at most the ordinary income
+    interest_deduction = -(min(total_interest, ordinary_income) * params.income_tax_rate)
     
     # Calculate social security contribution (trygdeavgift)
-    social_security_rate = social_security_rates[income_type]
-    social_security = income * social_security_rate
-    result['tax_components']['social_security'] = social_security
-    
-    # Calculate income tax (skatt på alminnelig inntekt)
-    # Interest payments are deductible from ordinary income
-    taxable_income = max(0, income - personal_deduction - total_interest)
-    income_tax = taxable_income * income_tax_rate
-    result['tax_components']['income_tax'] = income_tax
+    social_security = income * params.social_security_rates[income_type]
     
     # Calculate bracket tax (trinnskatt)
     # Bracket tax is not affected by interest deductions
-    bracket_tax = 0
-    remaining_income = income  # Use a copy so we don't modify the original
-    
-    for i in range(len(bracket_tax_thresholds) - 1, 0, -1):
-        threshold, rate = bracket_tax_thresholds[i]
-        if remaining_income > threshold:
-            bracket_tax += (remaining_income - threshold) * rate
-            remaining_income = threshold
-    
-    result['tax_components']['bracket_tax'] = bracket_tax
+    bracket_tax = sum([max(0, income - threshold) * delta for threshold, delta in params.bracket_tax_deltas])
     
     # Calculate wealth tax (formuesskatt)
     # Wealth tax is calculated on net wealth (assets minus liabilities)
     
     # Municipal wealth tax - 0.7% on net wealth above threshold
-    municipal_wealth_tax = max(0, (net_wealth_for_tax - wealth_tax_threshold) * municipal_wealth_tax_rate)
-    result['tax_components']['municipal_wealth_tax'] = municipal_wealth_tax
+    municipal_wealth_tax = max(0, (net_wealth_for_tax - params.wealth_tax_threshold) * params.municipal_wealth_tax_rate)
     
     # State wealth tax - progressive
-    state_wealth_tax = 0
-    remaining_wealth = net_wealth_for_tax  # Use a copy so we don't modify the original
-    
-    for i in range(len(state_wealth_tax_thresholds) - 1, -1, -1):
-        threshold, rate = state_wealth_tax_thresholds[i]
-        if remaining_wealth > threshold:
-            state_wealth_tax += (remaining_wealth - threshold) * rate
-            remaining_wealth = threshold
-    
-    result['tax_components']['state_wealth_tax'] = state_wealth_tax
+    state_wealth_tax = sum([max(0, net_wealth_for_tax - threshold) * delta for threshold, delta in params.state_wealth_tax_deltas])
     
     # Calculate total tax
-    total_tax = sum(result['tax_components'].values())
-    result['total_tax'] = total_tax
+    total_tax = interest_deduction + social_security + income_tax + bracket_tax + municipal_wealth_tax + state_wealth_tax
     
     # Calculate effective tax rate
-    if result['income'] > 0:
-        result['effective_tax_rate'] = total_tax / result['income']
-    else:
-        result['effective_tax_rate'] = 0
+    effective_tax_rate = total_tax / income if income > 0 else 0
+        
+    return TaxResult(
+        income_tax=income_tax,
+        bracket_tax=bracket_tax,
+        social_security=social_security,
+        interest_deduction=interest_deduction,
+        municipal_wealth_tax=municipal_wealth_tax,
+        state_wealth_tax=state_wealth_tax,
+        total_tax=total_tax,
+        effective_tax_rate=effective_tax_rate,
+        mortgage_interest=mortgage_interest,
+        other_loans_interest=other_loans_interest,
+        total_interest=total_interest,
+        total_debt=total_debt,
+        net_wealth_for_tax=net_wealth_for_tax
+    )
+
+
+def calculate_norwegian_tax(income, wealth, loans=0, mortgage=0, year=2025, primary_home_value=0, bank_balance=0, income_type='wage', 
+                            mortgage_interest_rate=0.04, other_loans_interest_rate=0.06):
+    """
+    Calculate Norwegian taxes based on income and wealth, accounting for loans and mortgages.
+    
+    Parameters:
+    -----------
+    income : float
+        Personal income in NOK
+    wealth : float
+        Gross wealth in NOK (before subtracting loans/mortgage)
+    loans : float, optional
+        Total non-mortgage loans in NOK (default: 0)
+    mortgage : float, optional
+        Mortgage debt in NOK (default: 0)
+    year : int, optional
+        Tax year (default: 2025)
+    primary_home_value : float, optional
+        Value of primary residence in NOK, used for wealth tax calculations (default: 0)
+    bank_balance : float, optional
+        Cash in bank accounts in NOK (default: 0)
+    income_type : str, optional
+        Type of income: 'wage', 'self_employment', or 'pension' (default: 'wage')
+    mortgage_interest_rate : float, optional
+        Annual interest rate on mortgage as a decimal (default: 0.04 which is 4%)
+    other_loans_interest_rate : float, optional
+        Annual interest rate on other loans as a decimal (default: 0.06 which is 6%)
         
-    return result
+    Returns:
+    --------
+    dict
+        Dictionary containing tax details
+    """
+    tax = calculate_tax_result(
+        income, wealth, loans=loans, mortgage=mortgage, year=year, primary_home_value=primary_home_value,
+        bank_balance=bank_balance, income_type=income_type, mortgage_interest_rate=mortgage_interest_rate,
+        other_loans_interest_rate=other_loans_interest_rate
+    )
+    
+    return {
+        'income': income,
+        'gross_wealth': wealth,
+        'loans': loans,
+        'mortgage': mortgage,
+        'primary_home_value': primary_home_value,
+        'bank_balance': bank_balance,
+        'income_type': income_type,
+        'year': year,
+        'tax_components': {
+            'interest_deduction': tax.interest_deduction,
+            'social_security': tax.social_security,
+            'income_tax': tax.income_tax,
+            'bracket_tax': tax.bracket_tax,
+            'municipal_wealth_tax': tax.municipal_wealth_tax,
+            'state_wealth_tax': tax.state_wealth_tax
+        },
+        'total_debt': tax.total_debt,
+        'net_wealth_for_tax': tax.net_wealth_for_tax,
+        'interest': {
+            'mortgage_interest_rate': mortgage_interest_rate,
+            'other_loans_interest_rate': other_loans_interest_rate,
+            'mortgage_interest': tax.mortgage_interest,
+            'other_loans_interest': tax.other_loans_interest,
+            'total_interest': tax.total_interest
+        },
+        'total_tax': tax.total_tax,
+        'effective_tax_rate': tax.effective_tax_rate
+    }
+
+def calculate_norwegian_tax_vec(income, wealth, loans=0, mortgage=0, year=2025, primary_home_value=0, bank_balance=0,
+                                income_type='wage', mortgage_interest_rate=0.04, other_loans_interest_rate=0.06):
+    """
+    Vectorized version of calculate_norwegian_tax for many taxpayers or years at once.
+
+    income, wealth, loans and mortgage may be NumPy arrays (or scalars) and are
+    broadcast against each other, so a whole projection is taxed in one call.
+    Each term is computed at the shape of the inputs it depends on, so passing
+    income as a column and wealth as a row taxes each income only once.
+    The income type and interest rates apply to every element.
+
+    Parameters:
+    -----------
+    income : float or numpy.ndarray
+        Personal income in NOK
+    wealth : float or numpy.ndarray
+        Gross wealth in NOK (before subtracting loans/mortgage)
+    loans : float or numpy.ndarray, optional
+        Total non-mortgage loans in NOK (default: 0)
+    mortgage : float or numpy.ndarray, optional
+        Mortgage debt in NOK (default: 0)
+    year : int, optional
+        Tax year (default: 2025)
+    primary_home_value : float, optional
+        Value of primary residence in NOK, used for wealth tax calculations (default: 0)
+    bank_balance : float, optional
+        Cash in bank accounts in NOK (default: 0)
+    income_type : str, optional
+        Type of income: 'wage', 'self_employment', or 'pension' (default: 'wage')
+    mortgage_interest_rate : float, optional
+        Annual interest rate on mortgage as a decimal (default: 0.04 which is 4%)
+    other_loans_interest_rate : float, optional
+        Annual interest rate on other loans as a decimal (default: 0.06 which is 6%)
+
+    Returns:
+    --------
+    dict
+        Same keys as calculate_norwegian_tax, with NumPy arrays in place of scalars
+    """
+    income, wealth, loans, mortgage = (
+        np.asarray(value, dtype=np.float64) for value in (income, wealth, loans, mortgage)
+    )
+
+    # Validate inputs
+    if np.any(income < 0):
+        raise ValueError('Income cannot be negative')
+    if np.any(wealth < 0):
+        raise ValueError('Wealth cannot be negative')
+    if np.any(loans < 0):
+        raise ValueError('Loans cannot be negative')
+    if np.any(mortgage < 0):
+        raise ValueError('Mortgage cannot be negative')
+    if primary_home_value < 0:
+        raise ValueError('Primary home value cannot be negative')
+    if bank_balance < 0:
+        raise ValueError('Bank balance cannot be negative')
+
+    if year not in [2024, 2025]:
+        raise ValueError(f'Tax calculations for year {year} are not supported. Use 2024 or 2025.')
+
+    if income_type not in ['wage', 'self_employment', 'pension']:
+        raise ValueError(f'Income type {income_type} is not supported. Use "wage", "self_employment", or "pension".')
+
+    params = _TAX_PARAMS[year]
+
+    # Debt and net wealth for tax purposes
+    total_debt = loans + mortgage
+    net_wealth_for_tax = np.maximum(0, wealth - total_debt)
+
+    # Interest expense
+    mortgage_interest = mortgage * mortgage_interest_rate
+    other_loans_interest = loans * other_loans_interest_rate
+    total_interest = mortgage_interest + other_loans_interest
+
+    # Ordinary income after the personal deduction
+    ordinary_income = np.maximum(0, income - params.personal_deduction)
+
+    tax_components = {}
+
+    # Interest deduction (negative as it reduces tax), limited to the income tax the interest can offset
+    tax_components['interest_deduction'] = -(np.minimum(total_interest, ordinary_income) * params.income_tax_rate)
+
+    # Social security contribution (trygdeavgift)
+    tax_components['social_security'] = income * params.social_security_rates[income_type]
+
+    # Income tax on ordinary income, before the interest deduction
+    tax_components['income_tax'] = ordinary_income * params.income_tax_rate
+
+    # Bracket tax (trinnskatt) - amount above each threshold times its rate increase, as one matrix-vector product
+    thresholds, deltas = np.array(params.bracket_tax_deltas).T
+    tax_components['bracket_tax'] = np.maximum(0, income[..., None] - thresholds) @ deltas
+
+    # Municipal wealth tax - flat rate on net wealth above threshold
+    tax_components['municipal_wealth_tax'] = np.maximum(
+        0, (net_wealth_for_tax - params.wealth_tax_threshold) * params.municipal_wealth_tax_rate
+    )
+
+    # State wealth tax - progressive, computed the same way as the bracket tax
+    thresholds, deltas = np.array(params.state_wealth_tax_deltas).T
+    tax_components['state_wealth_tax'] = np.maximum(0, net_wealth_for_tax[..., None] - thresholds) @ deltas
+
+    total_tax = sum(tax_components.values())
+    effective_tax_rate = np.divide(total_tax, income, out=np.zeros_like(total_tax), where=income > 0)
+
+    # Expand the terms that depend on only some of the inputs to the full result shape
+    shape = total_tax.shape
+    (income, wealth, loans, mortgage, total_debt, net_wealth_for_tax,
+     mortgage_interest, other_loans_interest, total_interest) = (
+        np.broadcast_to(value, shape) for value in (
+            income, wealth, loans, mortgage, total_debt, net_wealth_for_tax,
+            mortgage_interest, other_loans_interest, total_interest
+        )
+    )
+    tax_components = {name: np.broadcast_to(value, shape) for name, value in tax_components.items()}
+
+    return {
+        'income': income,
+        'gross_wealth': wealth,
+        'loans': loans,
+        'mortgage': mortgage,
+        'primary_home_value': primary_home_value,
+        'bank_balance': bank_balance,
+        'income_type': income_type,
+        'year': year,
+        'total_debt': total_debt,
+        'net_wealth_for_tax': net_wealth_for_tax,
+        'interest': {
+            'mortgage_interest_rate': mortgage_interest_rate,
+            'other_loans_interest_rate': other_loans_interest_rate,
+            'mortgage_interest': mortgage_interest,
+            'other_loans_interest': other_loans_interest,
+            'total_interest': total_interest
+        },
+        'tax_components': tax_components,
+        'total_tax': total_tax,
+        'effective_tax_rate': effective_tax_rate
+    }
 
 
 def tax_simulation(income_range, wealth_range, loans=0, mortgage=0, bank_balance=0, year=2025, income_type='wage',
@@ -286,44 +466,46 @@ def tax_simulation(income_range, wealth_range, loans=0, mortgage=0, bank_balance
     min_income, max_income, income_step = income_range
     min_wealth, max_wealth, wealth_step = wealth_range
     
-    income_values = range(min_income, max_income + 1, income_step)
-    wealth_values = range(min_wealth, max_wealth + 1, wealth_step)
+    income_values = np.arange(min_income, max_income + 1, income_step)
+    wealth_values = np.arange(min_wealth, max_wealth + 1, wealth_step)
     
-    results = []
+    # Every income paired with every wealth level, income-major like the nested loop it replaces
+    income_grid = np.repeat(income_values, len(wealth_values))
+    wealth_grid = np.tile(wealth_values, len(income_values))
     
-    for income in income_values:
-        for wealth in wealth_values:
-            tax_result = calculate_norwegian_tax(
-                income=income, 
-                wealth=wealth, 
-                loans=loans, 
-                mortgage=mortgage, 
-                bank_balance=bank_balance,
-                year=year, 
-                income_type=income_type,
-                mortgage_interest_rate=mortgage_interest_rate,
-                other_loans_interest_rate=other_loans_interest_rate
-            )
-            results.append({
-                'income': income,
-                'gross_wealth': wealth,
-                'net_wealth': wealth - loans - mortgage,
-                'bank_balance': bank_balance,
-                'loans': loans,
-                'mortgage': mortgage,
-                'total_interest': tax_result['interest']['total_interest'],
-                'total_tax': tax_result['total_tax'],
-                'effective_tax_rate': tax_result['effective_tax_rate'],
-                'income_tax': tax_result['tax_components'].get('income_tax', 0),
-                'bracket_tax': tax_result['tax_components'].get('bracket_tax', 0),
-                'social_security': tax_result['tax_components'].get('social_security', 0),
-                'interest_deduction': tax_result['tax_components'].get('interest_deduction', 0),
-                'municipal_wealth_tax': tax_result['tax_components'].get('municipal_wealth_tax', 0),
-                'state_wealth_tax': tax_result['tax_components'].get('state_wealth_tax', 0),
-            })
+    # Tax the whole grid in one vectorized call. Income runs down the rows and wealth across
+    # the columns, so the income-only taxes are computed once per income, not once per pair
+    tax_result = calculate_norwegian_tax_vec(
+        income=income_values[:, None], 
+        wealth=wealth_values[None, :], 
+        loans=loans, 
+        mortgage=mortgage, 
+        bank_balance=bank_balance,
+        year=year, 
+        income_type=income_type,
+        mortgage_interest_rate=mortgage_interest_rate,
+        other_loans_interest_rate=other_loans_interest_rate
+    )
+    tax_components = tax_result['tax_components']
+    grid_size = len(income_grid)
     
-    return pl.DataFrame(results)
-
+    return pl.DataFrame({
+        'income': income_grid,
+        'gross_wealth': wealth_grid,
+        'net_wealth': wealth_grid - loans - mortgage,
+        'bank_balance': np.full(grid_size, bank_balance),
+        'loans': np.full(grid_size, loans),
+        'mortgage': np.full(grid_size, mortgage),
+        'total_interest': tax_result['interest']['total_interest'].ravel(),
+        'total_tax': tax_result['total_tax'].ravel(),
+        'effective_tax_rate': tax_result['effective_tax_rate'].ravel(),
+        'income_tax': tax_components['income_tax'].ravel(),
+        'bracket_tax': tax_components['bracket_tax'].ravel(),
+        'social_security': tax_components['social_security'].ravel(),
+        'interest_deduction': tax_components['interest_deduction'].ravel(),
+        'municipal_wealth_tax': tax_components['municipal_wealth_tax'].ravel(),
+        'state_wealth_tax': tax_components['state_wealth_tax'].ravel(),
+    })
 
 def mortgage_impact_analysis(income, wealth, mortgage_values, bank_balance=0, year=2025, income_type='wage',
                            mortgage_interest_rate=0.04, other_loans_interest_rate=0.06):
@@ -354,37 +536,35 @@ def mortgage_impact_analysis(income, wealth, mortgage_values, bank_balance=0, ye
     polars.DataFrame
         DataFrame showing tax implications of different mortgage levels
     """
-    results = []
-    
-    for mortgage in mortgage_values:
-        tax_result = calculate_norwegian_tax(
-            income=income, 
-            wealth=wealth, 
-            mortgage=mortgage, 
-            bank_balance=bank_balance,
-            year=year, 
-            income_type=income_type,
-            mortgage_interest_rate=mortgage_interest_rate,
-            other_loans_interest_rate=other_loans_interest_rate
-        )
-        results.append({
-            'income': income,
-            'gross_wealth': wealth,
-            'mortgage': mortgage,
-            'net_wealth': wealth - mortgage,
-            'bank_balance': bank_balance,
-            'mortgage_interest': tax_result['interest']['mortgage_interest'],
-            'total_interest': tax_result['interest']['total_interest'],
-            'total_tax': tax_result['total_tax'],
-            'effective_tax_rate': tax_result['effective_tax_rate'],
-            'income_tax': tax_result['tax_components'].get('income_tax', 0),
-            'bracket_tax': tax_result['tax_components'].get('bracket_tax', 0),
-            'social_security': tax_result['tax_components'].get('social_security', 0),
-            'interest_deduction': tax_result['tax_components'].get('interest_deduction', 0),
-            'municipal_wealth_tax': tax_result['tax_components'].get('municipal_wealth_tax', 0),
-            'state_wealth_tax': tax_result['tax_components'].get('state_wealth_tax', 0),
-        })
+    # Tax every mortgage level in one vectorized call
+    mortgage_values = np.asarray(mortgage_values)
+    tax_result = calculate_norwegian_tax_vec(
+        income=income, 
+        wealth=wealth, 
+        mortgage=mortgage_values, 
+        bank_balance=bank_balance,
+        year=year, 
+        income_type=income_type,
+        mortgage_interest_rate=mortgage_interest_rate,
+        other_loans_interest_rate=other_loans_interest_rate
+    )
+    tax_components = tax_result['tax_components']
+    scenario_count = len(mortgage_values)
     
-    return pl.DataFrame(results)
-
-
+    return pl.DataFrame({
+        'income': np.full(scenario_count, income),
+        'gross_wealth': np.full(scenario_count, wealth),
+        'mortgage': mortgage_values,
+        'net_wealth': wealth - mortgage_values,
+        'bank_balance': np.full(scenario_count, bank_balance),
+        'mortgage_interest': tax_result['interest']['mortgage_interest'],
+        'total_interest': tax_result['interest']['total_interest'].ravel(),
+        'total_tax': tax_result['total_tax'].ravel(),
+        'effective_tax_rate': tax_result['effective_tax_rate'].ravel(),
+        'income_tax': tax_components['income_tax'].ravel(),
+        'bracket_tax': tax_components['bracket_tax'].ravel(),
+        'social_security': tax_components['social_security'].ravel(),
+        'interest_deduction': tax_components['interest_deduction'].ravel(),
+        'municipal_wealth_tax': tax_components['municipal_wealth_tax'].ravel(),
+        'state_wealth_tax': tax_components['state_wealth_tax'].ravel(),
+    })